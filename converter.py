@@ -1,7 +1,9 @@
 import json
 import sys
 import os
+import math
 from datetime import datetime
+import orjson
 
 # --- Configuration ---
 # ASSUMPTION: The script assumes the following mapping based on typical track data:
@@ -14,14 +16,14 @@ def convert_to_gpx(json_filepath):
     Reads a custom JSON file and converts its track data into a standard GPX format.
     """
     try:
-        # 1. Load the JSON data
-        with open(json_filepath, 'r') as f:
-            data = json.load(f)
+        # 1. Load the JSON data (orjson parses float-heavy track data much faster and needs bytes)
+        with open(json_filepath, 'rb') as f:
+            data = orjson.loads(f.read())
 
     except FileNotFoundError:
         print(f"Error: Input file not found at '{json_filepath}'")
         return
-    except json.JSONDecodeError:
+    except orjson.JSONDecodeError:
         print(f"Error: Failed to decode JSON from '{json_filepath}'. Please check the file format.")
         return
     except Exception as e:
@@ -39,8 +41,12 @@ def convert_to_gpx(json_filepath):
         # Fallback in case coordinates are structured differently (e.g., an array of segments)
         if isinstance(data, dict):
             # Try to find a list of coordinate dictionaries directly in a key value
+            # Coordinate lists are homogeneous, so checking the first few entries is enough
             for key, value in data.items():
-                if isinstance(value, list) and all(isinstance(p, dict) and all(c in p for c c in ['x', 'y', 'z']) for p in value):
+                if not isinstance(value, list):
+                    continue
+                sample = value[:3]
+                if sample and all(isinstance(p, dict) and {'x', 'y', 'z'} <= p.keys() for p in sample):
                     coordinates = value
                     print(f"Found coordinates in key: {key}")
                     break
@@ -49,58 +55,72 @@ def convert_to_gpx(json_filepath):
             print("Error: No valid coordinate data found. Ensure track points are a list of {'x', 'y', 'z'} objects.")
             return
 
-    # 3. Build the GPX track points (trkpt) string
-    track_points_xml = []
+    # 3. Validate the coordinates once, up front, so the formatting below needs no checks
+    valid_points = []
 
     for point in coordinates:
         try:
-            lat = point['y']
-            lon = point['x']
-            ele = point['z']
-
-            # Use current time as a placeholder for  if no time data exists
-            time_str = datetime.utcnow().isoformat() + 'Z'
-
-            trkpt = (
-                f'    \n'
-                f'      {ele:.2f}\n'
-                f'      {time_str}\n'
-                f'    '
-            )
-            track_points_xml.append(trkpt)
+            lon, lat, ele = float(point['x']), float(point['y']), float(point['z'])
+            if not all(math.isfinite(v) for v in (lon, lat, ele)):
+                raise ValueError("non-finite coordinate")
+            valid_points.append((lon, lat, ele))
         except KeyError as e:
             print(f"Warning: Skipping point due to missing key {e}. Point data: {point}")
             continue
+        except (TypeError, ValueError):
+            # Only the first few entries of a fallback list are validated up front, and
+            # None or non-numeric values would otherwise end up as "nan" in the GPX
+            print(f"Warning: Skipping point with invalid coordinates. Point data: {point}")
+            continue
 
-    if not track_points_xml:
+    if not valid_points:
         print("Error: Failed to generate any track points. Check the coordinate format.")
         return
 
-    # 4. Assemble the full GPX XML structure
-    gpx_content = f"""
-
-
-  
-
-  
-    {track_name}
-    
-{'\n'.join(track_points_xml)}
-    
-  
-
+    # Use the conversion time as a single placeholder <time> shared by every point
+    time_str = datetime.utcnow().isoformat(timespec='seconds') + 'Z'
+
+    # 4. Assemble the GPX XML structure around the track points
+    gpx_header = f"""<?xml version="1.0" encoding="UTF-8"?>
+<gpx
+    xmlns="http://www.topografix.com/GPX/1/1"
+    version="1.1"
+    creator="JSON to GPX Converter"
+    xmlns:xsi="http://www.w3.org/2001/XMLSchema-instance"
+    xsi:schemaLocation="http://www.topografix.com/GPX/1/1 http://www.topografix.com/GPX/1/1/gpx.xsd">
+
+  <metadata>
+    <name>{track_name}</name>
+  </metadata>
+
+  <trk>
+    <name>{track_name}</name>
+    <trkseg>
+"""
+    gpx_footer = """    </trkseg>
+  </trk>
+</gpx>
 """
 
-    # 5. Save the output file
+    # 5. Stream the track points straight into a large file buffer instead of building
+    # the whole document in memory first
     base_name = os.path.splitext(json_filepath)[0]
     gpx_filepath = base_name + '.gpx'
 
-    with open(gpx_filepath, 'w') as f:
-        f.write(gpx_content)
+    with open(gpx_filepath, 'w', encoding='utf-8', buffering=1 << 20) as f:
+        f.write(gpx_header)
+        f.writelines(
+            f'    <trkpt lat="{lat:.8f}" lon="{lon:.8f}">\n'
+            f'      <ele>{ele:.2f}</ele>\n'
+            f'      <time>{time_str}</time>\n'
+            f'    </trkpt>\n'
+            for lon, lat, ele in valid_points
+        )
+        f.write(gpx_footer)
 
     print(f"\nSuccessfully converted '{json_filepath}' to '{gpx_filepath}'.")
     print(f"Track Name: {track_name}")
-    print(f"Total Track Points Converted: {len(track_points_xml)}")
+    print(f"Total Track Points Converted: {len(valid_points)}")
 
 
 # --- Original main block modified for Colab usage ---
@@ -141,5 +161,5 @@ if __name__ == "__main__":
             input_file = sys.argv[1]
             convert_to_gpx(input_file)
         else:
-            print("Usage: python json_to_gpx.py ")
+            print("Usage: python json_to_gpx.py <input_file.json>")
             sys.exit(1)
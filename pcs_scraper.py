@@ -0,0 +1,274 @@
+import requests_cache
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+import lxml.html
+from selectolax.lexbor import LexborHTMLParser
+import csv
+import html
+import re
+import numpy as np
+import pandas as pd
+from concurrent.futures import ThreadPoolExecutor
+
+# Configuration
+BASE_URL = "https://www.procyclingstats.com/"
+CALENDAR_URL = "https://www.procyclingstats.com/calendar/start-finish-schedule"
+OUTPUT_FILE = "race_schedule.csv"
+CACHE_NAME = "pcs_cache"
+CSV_FIELDS = [
+    "Date", "Local Starttime", "Race", "Starttime (Denver)", "Expected Finishtime (Denver)",
+    "Classification", "Distance", "ProfileScore", "Startlist Quality Score"
+]
+
+# Flush the CSV to disk every this many rows while the scrape is running
+CSV_FLUSH_EVERY = 50
+
+# Detail pages are fetched in parallel; keep this modest to avoid blocks
+MAX_WORKERS = 8
+
+# Enhanced headers to bypass 403 Forbidden errors
+HEADERS = {
+    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/121.0.0.0 Safari/537.36",
+    "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,image/apng,*/*;q=0.8",
+    "Accept-Language": "en-US,en;q=0.9",
+    "Accept-Encoding": "gzip, deflate, br",
+    "Referer": "https://www.google.com/",
+    "Connection": "keep-alive",
+    "Sec-Ch-Ua": '"Not A(Brand";v="99", "Google Chrome";v="121", "Chromium";v="121"',
+    "Sec-Ch-Ua-Mobile": "?0",
+    "Sec-Ch-Ua-Platform": '"Windows"',
+    "Upgrade-Insecure-Requests": "1"
+}
+
+# Detail pages are small and scanned straight from the raw bytes, so skip the gzip
+# round trip for them; the larger calendar page keeps compression
+DETAIL_HEADERS = {"Accept-Encoding": "identity"}
+
+# One shared session for every request so cookies persist and keep-alive
+# connections to procyclingstats.com skip the TCP/TLS handshake after the first hit.
+# Successful race pages are cached on disk for a day so re-runs barely touch the network;
+# the calendar itself is never cached so every run writes the current schedule.
+# HEADERS must not carry Cache-Control, which requests-cache would honor for every request.
+SESSION = requests_cache.CachedSession(
+    CACHE_NAME, backend='sqlite', expire_after=86400, allowable_codes=(200,),
+    urls_expire_after={CALENDAR_URL: requests_cache.DO_NOT_CACHE}
+)
+SESSION.headers.update(HEADERS)
+SESSION.mount("https://", HTTPAdapter(
+    pool_connections=1,
+    pool_maxsize=2 * MAX_WORKERS,
+    max_retries=Retry(total=2, backoff_factor=0.3)
+))
+
+# Belgium is typically CET (UTC+1) or CEST (UTC+2)
+BELGIUM_TZ = "Europe/Brussels"
+DENVER_TZ = "America/Denver"
+
+def to_denver_times(dates, times):
+    """
+    Converts Series of PCS dates and Belgium times (HH:MM) to Denver times in one vectorized pass.
+    """
+    # Date format on PCS is usually "19 February 2026"
+    belgium_dt = pd.to_datetime(dates + " " + times, format="%d %B %Y %H:%M", errors="coerce")
+    # The repeated hour when DST ends resolves to standard time, as pytz's localize did
+    denver_dt = belgium_dt.dt.tz_localize(
+        BELGIUM_TZ, nonexistent="shift_forward", ambiguous=np.zeros(len(times), dtype=bool)
+    ).dt.tz_convert(DENVER_TZ)
+    
+    # Unparseable times keep the scraped text, and placeholders like "-" become blank
+    denver_times = denver_dt.dt.strftime("%H:%M").where(belgium_dt.notna(), times)
+    has_time = times.str.contains(":", regex=False) & (times != "-") & (times.str.len() >= 3)
+    return denver_times.where(has_time, "")
+
+# Labels used in a race page's info list, mapped to our CSV column names
+INFOLIST_FIELDS = {
+    "Classification": "Classification",
+    "Distance": "Distance",
+    "ProfileScore": "ProfileScore",
+    "Startlist quality score": "Startlist Quality Score"
+}
+
+def infolist_field(label):
+    """
+    Maps an info list label to its CSV column, or None for labels we don't keep.
+    """
+    if label in INFOLIST_FIELDS:
+        return INFOLIST_FIELDS[label]
+    # The quality score label can carry extra text, so match it as a substring
+    if "Startlist quality score" in label:
+        return "Startlist Quality Score"
+    return None
+
+# Matches "<li><div>Label:</div><div>value</div>" entries straight from the raw page bytes
+INFOLIST_RX = re.compile(
+    rb'<li[^>]*>\s*<[^>]+>\s*(' + b'|'.join(re.escape(label.encode()) for label in INFOLIST_FIELDS)
+    + rb'):?\s*</[^>]+>\s*<[^>]+>([^<]*)</'
+)
+
+def empty_race_details():
+    """
+    Returns the blank metadata used when a race page is missing or unreadable.
+    """
+    return {
+        "Classification": "",
+        "Distance": "",
+        "ProfileScore": "",
+        "Startlist Quality Score": ""
+    }
+
+def parse_infolist(content):
+    """
+    Parses the info list of a race page with selectolax and returns the fields it finds.
+    """
+    # Detail pages only need the info list, so use the much faster selectolax parser
+    tree = LexborHTMLParser(content)
+    info_list = tree.css_first('ul.infolist')
+    if not info_list:
+        return {}
+    
+    # Each <li> holds a label node and a value node, so read those two directly
+    details = {}
+    for item in info_list.css('li'):
+        nodes = list(item.iter())
+        if len(nodes) >= 2:
+            field = infolist_field(nodes[0].text(strip=True).replace(":", "").strip())
+            if field:
+                details[field] = nodes[1].text(strip=True)
+    
+    return details
+
+def scrape_race_details(race_url):
+    """
+    Scrapes specific metadata from an individual race page using the shared session.
+    """
+    details = empty_race_details()
+    
+    try:
+        print(f"Fetching details for: {race_url}")
+        response = SESSION.get(race_url, headers=DETAIL_HEADERS, timeout=15)
+        if response.status_code != 200:
+            return details
+        
+        # Most pages match the regex for every field, which avoids building a tree at all
+        for match in INFOLIST_RX.finditer(response.content):
+            field = INFOLIST_FIELDS[match.group(1).decode()]
+            details[field] = html.unescape(match.group(2).decode('utf-8', 'replace')).strip()
+        
+        if not all(details.values()):
+            details.update(parse_infolist(response.content))
+    except Exception as e:
+        print(f"Error scraping details for {race_url}: {e}")
+        
+    return details
+
+def main():
+    print(f"Starting scrape of {CALENDAR_URL}...")
+    
+    try:
+        response = SESSION.get(CALENDAR_URL, stream=True, timeout=15)
+        response.raise_for_status()
+        
+        # Feed the body into lxml chunk by chunk instead of decoding it into one big string
+        # Raw bytes lose the charset from the Content-Type header, so pass it on explicitly
+        parser = lxml.html.HTMLParser(encoding=response.encoding or 'utf-8')
+        for chunk in response.iter_content(chunk_size=64 * 1024):
+            parser.feed(chunk)
+        root = parser.close()
+    except Exception as e:
+        print(f"Failed to fetch calendar page: {e}")
+        # Help user debug by showing response info
+        if 'response' in locals():
+            print(f"Status Code: {response.status_code}")
+        return
+    
+    # Find the main schedule table, falling back to the first one with a "Race" header
+    tables = (
+        root.xpath("(//table[contains(concat(' ', normalize-space(@class), ' '), ' basic ')])[1]")
+        or root.xpath("(//table[.//th[contains(., 'Race')]])[1]")
+    )
+    
+    if not tables:
+        print("Could not find the race table. Site structure may have changed.")
+        return
+
+    table = tables[0]
+    rows = table.xpath('./tbody/tr') or table.xpath('.//tr')
+    races = []
+
+    for row in rows:
+        cols = row.xpath('./td')
+        if len(cols) < 5:
+            continue
+            
+        date = cols[0].text_content().strip()
+        local_start = cols[1].text_content().strip()
+        race_cell = cols[2]
+        race_name = race_cell.text_content().strip()
+        belgium_start = cols[3].text_content().strip()
+        belgium_finish = cols[4].text_content().strip()
+        
+        # Skip labels or headers
+        if not date or "Date" in date or "Race" in race_name:
+            continue
+
+        race_hrefs = race_cell.xpath('.//a/@href')
+        full_race_url = None
+        if race_hrefs:
+            race_href = race_hrefs[0]
+            full_race_url = race_href if race_href.startswith('http') else BASE_URL + race_href
+
+        races.append({
+            "Date": date,
+            "Local Starttime": local_start,
+            "Race": race_name,
+            "Belgium Start": belgium_start,
+            "Belgium Finish": belgium_finish,
+            "url": full_race_url
+        })
+
+    if not races:
+        print("No race data found in the table.")
+        return
+
+    schedule = pd.DataFrame(races)
+    schedule["Starttime (Denver)"] = to_denver_times(schedule["Date"], schedule["Belgium Start"])
+    schedule["Expected Finishtime (Denver)"] = to_denver_times(schedule["Date"], schedule["Belgium Finish"])
+
+    # Stage races can list the same race page several times, so fetch each URL once
+    race_urls = list(dict.fromkeys(race["url"] for race in races if race["url"]))
+    saved = 0
+
+    # Rows are written as soon as their details arrive, so a crash mid-scrape keeps
+    # everything fetched so far. The worker count doubles as the rate limit.
+    executor = ThreadPoolExecutor(max_workers=MAX_WORKERS)
+    try:
+        with open(OUTPUT_FILE, 'w', newline='', encoding='utf-8', buffering=1 << 20) as f:
+            pending = {url: executor.submit(scrape_race_details, url) for url in race_urls}
+            writer = csv.writer(f)
+            writer.writerow(CSV_FIELDS)
+
+            for race in schedule.to_dict("records"):
+                race_details = pending[race["url"]].result() if race["url"] in pending else empty_race_details()
+
+                # Positional rows in CSV_FIELDS order, so no per-row dict is built and looked up
+                writer.writerow((
+                    race["Date"],
+                    race["Local Starttime"],
+                    race["Race"],
+                    race["Starttime (Denver)"],
+                    race["Expected Finishtime (Denver)"],
+                    race_details["Classification"],
+                    race_details["Distance"],
+                    race_details["ProfileScore"],
+                    race_details["Startlist Quality Score"]
+                ))
+                saved += 1
+                if saved % CSV_FLUSH_EVERY == 0:
+                    f.flush()
+    except BaseException:
+        # Drop the queued detail fetches on an error or Ctrl-C instead of waiting for all of them
+        executor.shutdown(wait=False, cancel_futures=True)
+        raise
+    executor.shutdown()
+    
+    print(f"Successfully saved {saved} races to {OUTPUT_FILE}")